@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-15 10:04
+
+from django.db import migrations, models
+
+
+def set_is_assigned(apps, schema_editor):
+    for model_name in ("Tag", "Ingredient"):
+        model = apps.get_model("core", model_name)
+        model.objects.filter(recipe__isnull=False).update(is_assigned=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_recipe_tag_ingredient_user_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ingredient",
+            name="is_assigned",
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name="tag",
+            name="is_assigned",
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.RunPython(set_is_assigned, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-15 11:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_ingredient_is_assigned_tag_is_assigned"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ingredient",
+            name="is_assigned",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="tag",
+            name="is_assigned",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+    ]
@@ -8,14 +8,16 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 
+RECIPE_IMAGE_DIR = os.path.join("uploads", "recipe")
+
 
 def recipe_image_file_path(instance, filepath):
     """Generate file path for new recipe image."""
     ext = os.path.splitext(filepath)[1]
 
-    filename = f"{uuid.uuid4()}{ext}"
+    filename = uuid.uuid4().hex + ext
 
-    return os.path.join("uploads", "recipe", filename)
+    return os.path.join(RECIPE_IMAGE_DIR, filename)
 
 
 class UserManager(BaseUserManager):
@@ -80,6 +82,9 @@ class Recipe(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     image = models.ImageField(null=True, upload_to=recipe_image_file_path)
 
+    class Meta:
+        indexes = [models.Index(fields=["user", "-id"], name="recipe_user_id_desc_idx")]
+
     def __str__(self):
         return self.title
 
@@ -90,6 +95,11 @@ class Recipe(models.Model):
 class Tag(models.Model):
     name = models.CharField(max_length=255)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    # kept in sync with recipe assignments by core.signals
+    is_assigned = models.BooleanField(default=False, db_index=True, editable=False)
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "name"], name="tag_user_name_idx")]
 
     def __str__(self):
         return self.name
@@ -98,6 +108,13 @@ class Tag(models.Model):
 class Ingredient(models.Model):
     name = models.CharField(max_length=255)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    # kept in sync with recipe assignments by core.signals
+    is_assigned = models.BooleanField(default=False, db_index=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "name"], name="ingredient_user_name_idx")
+        ]
 
     def __str__(self):
         return self.name
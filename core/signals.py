@@ -0,0 +1,63 @@
+"""
+Signal handlers keeping denormalized model fields in sync.
+"""
+
+from django.db.models import Exists, OuterRef
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+from django.dispatch import receiver
+
+from core.models import Ingredient, Recipe, Tag
+
+ASSIGNMENT_LINKS = {
+    Tag: (Recipe.tags.through, "tag_id"),
+    Ingredient: (Recipe.ingredients.through, "ingredient_id"),
+}
+
+
+def sync_is_assigned(model, pks):
+    """Recompute is_assigned for the given tags or ingredients."""
+    if not pks:
+        return
+    through, field = ASSIGNMENT_LINKS[model]
+    model.objects.filter(pk__in=pks).update(
+        is_assigned=Exists(through.objects.filter(**{field: OuterRef("pk")}))
+    )
+
+
+@receiver(m2m_changed, sender=Recipe.tags.through)
+@receiver(m2m_changed, sender=Recipe.ingredients.through)
+def update_is_assigned(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Track whether tags and ingredients are assigned to any recipe."""
+    if reverse:
+        # changed from the tag/ingredient side, e.g. tag.recipe_set.add(...)
+        if action in ("post_add", "post_remove", "post_clear"):
+            sync_is_assigned(type(instance), [instance.pk])
+        return
+
+    if action == "post_add":
+        model.objects.filter(pk__in=pk_set).update(is_assigned=True)
+    elif action == "post_remove":
+        sync_is_assigned(model, pk_set)
+    elif action == "pre_clear":
+        through, field = ASSIGNMENT_LINKS[model]
+        instance._cleared_attr_ids = list(
+            through.objects.filter(recipe_id=instance.pk).values_list(field, flat=True)
+        )
+    elif action == "post_clear":
+        sync_is_assigned(model, getattr(instance, "_cleared_attr_ids", None))
+
+
+@receiver(pre_delete, sender=Recipe)
+def collect_recipe_attrs(sender, instance, **kwargs):
+    """Remember a deleted recipe's tags and ingredients for post_delete."""
+    instance._deleted_tag_ids = list(instance.tags.values_list("id", flat=True))
+    instance._deleted_ingredient_ids = list(
+        instance.ingredients.values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Recipe)
+def release_recipe_attrs(sender, instance, **kwargs):
+    """Unflag tags and ingredients left without a recipe."""
+    sync_is_assigned(Tag, getattr(instance, "_deleted_tag_ids", None))
+    sync_is_assigned(Ingredient, getattr(instance, "_deleted_ingredient_ids", None))
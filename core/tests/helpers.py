@@ -0,0 +1,23 @@
+"""
+Shared helpers for tests.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+
+from core.models import Recipe
+
+
+def create_user(email="user@example.com", password="testpass123", **params):
+    """Create and return a new user."""
+    return get_user_model().objects.create_user(
+        email=email, password=password, **params
+    )
+
+
+def create_recipe(user, **params):
+    """Create and return a sample recipe."""
+    defaults = {"title": "Sample recipe", "time_minutes": 10, "price": Decimal("5.50")}
+    defaults.update(params)
+    return Recipe.objects.create(user=user, **defaults)
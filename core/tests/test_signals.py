@@ -0,0 +1,81 @@
+"""
+Tests for keeping Tag.is_assigned and Ingredient.is_assigned in sync.
+"""
+
+from django.test import TestCase
+
+from core.models import Ingredient, Tag
+from core.tests.helpers import create_recipe, create_user
+
+
+class IsAssignedSyncTests(TestCase):
+    """Test the is_assigned flag follows recipe assignments."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.recipe = create_recipe(self.user)
+        self.tag = Tag.objects.create(user=self.user, name="Vegan")
+        self.ingredient = Ingredient.objects.create(user=self.user, name="Salt")
+
+    def assertAssigned(self, obj, expected):
+        obj.refresh_from_db()
+        self.assertIs(obj.is_assigned, expected)
+
+    def test_add_sets_flag(self):
+        self.recipe.tags.add(self.tag)
+        self.recipe.ingredients.add(self.ingredient)
+
+        self.assertAssigned(self.tag, True)
+        self.assertAssigned(self.ingredient, True)
+
+    def test_remove_clears_flag(self):
+        self.recipe.tags.add(self.tag)
+        self.recipe.ingredients.add(self.ingredient)
+
+        self.recipe.tags.remove(self.tag)
+        self.recipe.ingredients.remove(self.ingredient)
+
+        self.assertAssigned(self.tag, False)
+        self.assertAssigned(self.ingredient, False)
+
+    def test_remove_keeps_flag_while_other_recipe_assigned(self):
+        other = create_recipe(self.user, title="Other")
+        self.recipe.tags.add(self.tag)
+        other.tags.add(self.tag)
+
+        self.recipe.tags.remove(self.tag)
+
+        self.assertAssigned(self.tag, True)
+
+    def test_clear_clears_flag(self):
+        self.recipe.tags.add(self.tag)
+        self.recipe.ingredients.add(self.ingredient)
+
+        self.recipe.tags.clear()
+        self.recipe.ingredients.clear()
+
+        self.assertAssigned(self.tag, False)
+        self.assertAssigned(self.ingredient, False)
+
+    def test_reverse_add_and_remove(self):
+        self.tag.recipe_set.add(self.recipe)
+        self.assertAssigned(self.tag, True)
+
+        self.tag.recipe_set.remove(self.recipe)
+        self.assertAssigned(self.tag, False)
+
+    def test_reverse_clear(self):
+        self.ingredient.recipe_set.add(self.recipe)
+
+        self.ingredient.recipe_set.clear()
+
+        self.assertAssigned(self.ingredient, False)
+
+    def test_recipe_delete_clears_flag(self):
+        self.recipe.tags.add(self.tag)
+        self.recipe.ingredients.add(self.ingredient)
+
+        self.recipe.delete()
+
+        self.assertAssigned(self.tag, False)
+        self.assertAssigned(self.ingredient, False)
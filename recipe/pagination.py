@@ -0,0 +1,64 @@
+"""
+Pagination for the recipe app.
+"""
+
+import hashlib
+from functools import cached_property, partial
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from rest_framework.pagination import PageNumberPagination
+
+COUNT_CACHE_TIMEOUT = 300
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reads the total row count from the cache when it can."""
+
+    def __init__(self, *args, count_key=None, refresh=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_key = count_key
+        self.refresh = refresh
+
+    @cached_property
+    def count(self):
+        """Return the cached count, running COUNT(*) only on a miss or refresh."""
+        if not self.refresh:
+            count = cache.get(self.count_key)
+            if count is not None:
+                return count
+        count = super().count
+        cache.set(self.count_key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Page number pagination that caches the COUNT(*) per user, path and filters.
+    The first page always recounts, so later pages see a fresh total.
+    Pagination is opt-in through the page_size query parameter.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def _count_cache_key(self, request):
+        """Build a cache key from the user, path and filtering query params."""
+        page_params = (self.page_query_param, self.page_size_query_param)
+        params = sorted(
+            (key, value)
+            for key, value in request.query_params.items()
+            if key not in page_params
+        )
+        raw = repr((request.user.id, request.path, params)).encode()
+        digest = hashlib.md5(raw, usedforsecurity=False).hexdigest()
+        return f"page-count:{digest}"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_number = request.query_params.get(self.page_query_param)
+        self.django_paginator_class = partial(
+            CachedCountPaginator,
+            count_key=self._count_cache_key(request),
+            refresh=page_number in (None, "", "1"),
+        )
+        return super().paginate_queryset(queryset, request, view)
@@ -2,14 +2,25 @@ from rest_framework import serializers
 from core.models import Ingredient, Tag, Recipe
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class RecipeAttrSerializer(serializers.ModelSerializer):
+    """Base serializer for recipe attributes (tags and ingredients)."""
+
+    def update(self, instance, validated_data):
+        """Save edited fields only, leaving the signal-maintained is_assigned."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
+
+
+class IngredientSerializer(RecipeAttrSerializer):
     class Meta:
         model = Ingredient
         fields = ["id", "name"]
         read_only_fields = ["id"]
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(RecipeAttrSerializer):
     class Meta:
         model = Tag
         fields = ["id", "name"]
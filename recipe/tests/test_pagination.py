@@ -0,0 +1,69 @@
+"""
+Tests for recipe list pagination.
+"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.tests.helpers import create_recipe, create_user
+
+RECIPES_URL = reverse("recipe:recipe-list")
+
+
+def count_queries(queries):
+    return [q["sql"] for q in queries if "COUNT(" in q["sql"].upper()]
+
+
+class CachedCountPaginationTests(TestCase):
+    """Test the cached COUNT(*) of the recipe list."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for _ in range(2):
+            create_recipe(self.user)
+
+    def get_page(self, page):
+        return self.client.get(RECIPES_URL, {"page": page, "page_size": 1})
+
+    def test_later_pages_use_cached_count(self):
+        self.get_page(1)
+        create_recipe(self.user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.get_page(2)
+
+        self.assertEqual(res.data["count"], 2)
+        self.assertEqual(count_queries(ctx.captured_queries), [])
+
+    def test_first_page_recounts(self):
+        self.get_page(1)
+        create_recipe(self.user)
+
+        res = self.get_page(1)
+
+        self.assertEqual(res.data["count"], 3)
+        self.assertEqual(self.get_page(2).data["count"], 3)
+
+    def test_count_cached_per_user(self):
+        self.get_page(1)
+        other = create_user(email="other@example.com")
+        for _ in range(3):
+            create_recipe(other)
+        self.client.force_authenticate(other)
+
+        res = self.get_page(2)
+
+        self.assertEqual(res.data["count"], 3)
+
+    def test_without_page_size_returns_list(self):
+        res = self.client.get(RECIPES_URL)
+
+        self.assertIsInstance(res.data, list)
+        self.assertEqual(len(res.data), 2)
@@ -0,0 +1,179 @@
+"""
+Tests for the recipe API.
+"""
+
+import json
+import tempfile
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+
+from PIL import Image
+from django.core.cache import cache
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.models import Ingredient, Recipe, Tag
+from core.tests.helpers import create_recipe, create_user
+from recipe.serializers import RecipeImageSerializer, RecipeSerializer
+
+RECIPES_URL = reverse("recipe:recipe-list")
+
+
+def as_json(data):
+    """Round-trip serializer data through the JSON renderer."""
+    return json.loads(JSONRenderer().render(data))
+
+
+def sort_nested(recipes):
+    """Sort nested tags and ingredients, whose order the API doesn't fix."""
+    for recipe in recipes:
+        for attr in ("tags", "ingredients"):
+            recipe[attr].sort(key=lambda item: item["id"])
+    return recipes
+
+
+def image_upload_url(recipe_id):
+    """Create and return an image upload URL."""
+    return reverse("recipe:recipe-upload-image", args=[recipe_id])
+
+
+class RecipeListTests(TestCase):
+    """Test listing recipes."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_attaches_tags_and_ingredients(self):
+        tagged = create_recipe(self.user, title="Curry")
+        vegan = Tag.objects.create(user=self.user, name="Vegan")
+        dinner = Tag.objects.create(user=self.user, name="Dinner")
+        salt = Ingredient.objects.create(user=self.user, name="Salt")
+        tagged.tags.add(vegan, dinner)
+        tagged.ingredients.add(salt)
+        plain = create_recipe(self.user, title="Toast")
+
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([recipe["id"] for recipe in res.data], [plain.id, tagged.id])
+        self.assertEqual(res.data[0]["tags"], [])
+        self.assertEqual(res.data[0]["ingredients"], [])
+        self.assertCountEqual(
+            res.data[1]["tags"],
+            [{"id": vegan.id, "name": "Vegan"}, {"id": dinner.id, "name": "Dinner"}],
+        )
+        self.assertEqual(res.data[1]["ingredients"], [{"id": salt.id, "name": "Salt"}])
+
+    def test_list_matches_serializer(self):
+        """The hand-built list output matches RecipeSerializer."""
+        vegan = Tag.objects.create(user=self.user, name="Vegan")
+        dinner = Tag.objects.create(user=self.user, name="Dinner")
+        salt = Ingredient.objects.create(user=self.user, name="Salt")
+        curry = create_recipe(
+            self.user, title="Curry", price=Decimal("12.00"), link="http://x.io"
+        )
+        curry.tags.add(vegan, dinner)
+        curry.ingredients.add(salt)
+        create_recipe(self.user, title="Toast", price=Decimal("0.5"))
+
+        res = self.client.get(RECIPES_URL)
+
+        recipes = Recipe.objects.filter(user=self.user).order_by("-id")
+        expected = RecipeSerializer(recipes, many=True).data
+        self.assertEqual(sort_nested(res.json()), sort_nested(as_json(expected)))
+
+    def test_list_limited_to_user(self):
+        create_recipe(create_user(email="other@example.com"))
+        recipe = create_recipe(self.user)
+
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual([recipe["id"] for recipe in res.data], [recipe.id])
+
+    def test_list_empty(self):
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, [])
+
+    def test_list_empty_page(self):
+        res = self.client.get(RECIPES_URL, {"page_size": 10})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["count"], 0)
+        self.assertEqual(res.data["results"], [])
+
+
+class RecipeFilterTests(TestCase):
+    """Test filtering recipes by tags and ingredients."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_filter_by_tags(self):
+        tag = Tag.objects.create(user=self.user, name="Vegan")
+        tagged = create_recipe(self.user)
+        tagged.tags.add(tag)
+        create_recipe(self.user)
+
+        res = self.client.get(RECIPES_URL, {"tags": f"{tag.id},{tag.id + 100}"})
+
+        self.assertEqual([recipe["id"] for recipe in res.data], [tagged.id])
+
+    def test_malformed_ids_rejected(self):
+        for value in ["abc", "1,", ",1", "1,,2", "1,2\n", "1; 2"]:
+            for param in ["tags", "ingredients"]:
+                with self.subTest(param=param, value=value):
+                    res = self.client.get(RECIPES_URL, {param: value})
+
+                    self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ImageUploadTests(TestCase):
+    """Test uploading recipe images."""
+
+    def setUp(self):
+        self.media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.recipe = create_recipe(self.user)
+
+    def test_upload_streams_to_temporary_file(self):
+        buffer = BytesIO()
+        Image.new("RGB", (10, 10)).save(buffer, format="JPEG")
+        buffer.name = "image.jpg"
+        buffer.seek(0)
+        received = []
+
+        def capture(value):
+            received.append(value)
+            return value
+
+        with mock.patch.object(
+            RecipeImageSerializer, "validate_image", side_effect=capture, create=True
+        ):
+            res = self.client.post(
+                image_upload_url(self.recipe.id), {"image": buffer}, format="multipart"
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(received[0], TemporaryUploadedFile)
+        self.recipe.refresh_from_db()
+        self.assertTrue(self.recipe.image.name.startswith("uploads/recipe/"))
@@ -0,0 +1,132 @@
+"""
+Tests for the tags API.
+"""
+
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Tag
+from core.tests.helpers import create_recipe, create_user
+from recipe.serializers import TagSerializer
+from recipe.views import TagViewSet
+
+TAGS_URL = reverse("recipe:tag-list")
+
+
+def detail_url(tag_id):
+    """Create and return a tag detail URL."""
+    return reverse("recipe:tag-detail", args=[tag_id])
+
+
+class TagListETagTests(TestCase):
+    """Test conditional requests against the tag list endpoint."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.tag = Tag.objects.create(user=self.user, name="Dinner")
+
+    def test_unchanged_list_returns_304(self):
+        etag = self.client.get(TAGS_URL)["ETag"]
+
+        res = self.client.get(TAGS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res["ETag"], etag)
+
+    def test_changed_tag_invalidates_etag(self):
+        etag = self.client.get(TAGS_URL)["ETag"]
+        self.tag.name = "Lunch"
+        self.tag.save()
+
+        res = self.client.get(TAGS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.data[0]["name"], "Lunch")
+
+    def test_assignment_invalidates_assigned_only_etag(self):
+        params = {"assigned_only": 1}
+        etag = self.client.get(TAGS_URL, params)["ETag"]
+        create_recipe(self.user).tags.add(self.tag)
+
+        res = self.client.get(TAGS_URL, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([tag["id"] for tag in res.data], [self.tag.id])
+
+
+class TagListTests(TestCase):
+    """Test listing tags."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_assigned_only_filters_tags(self):
+        assigned = Tag.objects.create(user=self.user, name="Dinner")
+        Tag.objects.create(user=self.user, name="Breakfast")
+        create_recipe(self.user).tags.add(assigned)
+
+        res_all = self.client.get(TAGS_URL)
+        res_assigned = self.client.get(TAGS_URL, {"assigned_only": 1})
+
+        self.assertEqual(len(res_all.data), 2)
+        self.assertEqual([tag["id"] for tag in res_assigned.data], [assigned.id])
+
+    def test_list_matches_serializer(self):
+        """The hand-built list output matches TagSerializer."""
+        Tag.objects.create(user=self.user, name="Dinner")
+        Tag.objects.create(user=self.user, name="Breakfast")
+
+        res = self.client.get(TAGS_URL)
+
+        tags = Tag.objects.filter(user=self.user).order_by("-name")
+        self.assertEqual(res.json(), TagSerializer(tags, many=True).data)
+
+    def test_change_visible_on_next_request(self):
+        tag = Tag.objects.create(user=self.user, name="Dinner")
+        self.client.get(TAGS_URL)
+        tag.name = "Lunch"
+        tag.save()
+
+        res = self.client.get(TAGS_URL)
+
+        self.assertEqual(res.data, [{"id": tag.id, "name": "Lunch"}])
+
+
+class TagUpdateTests(TestCase):
+    """Test updating tags."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.tag = Tag.objects.create(user=self.user, name="Vegan")
+
+    def test_update_tag(self):
+        res = self.client.patch(detail_url(self.tag.id), {"name": "Dinner"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, {"id": self.tag.id, "name": "Dinner"})
+        self.tag.refresh_from_db()
+        self.assertEqual(self.tag.name, "Dinner")
+
+    def test_update_does_not_overwrite_is_assigned(self):
+        """A tag loaded before being assigned keeps the flag when edited."""
+        stale_tag = Tag.objects.get(pk=self.tag.pk)
+        create_recipe(self.user).tags.add(self.tag)
+
+        with mock.patch.object(TagViewSet, "get_object", return_value=stale_tag):
+            res = self.client.patch(detail_url(self.tag.id), {"name": "Dinner"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.tag.refresh_from_db()
+        self.assertEqual(self.tag.name, "Dinner")
+        self.assertIs(self.tag.is_assigned, True)
@@ -1,11 +1,19 @@
+import re
+from functools import lru_cache
+
 from rest_framework import status, mixins, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import viewsets
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.shortcuts import get_object_or_404
+from django.db.models import Exists, OuterRef, Prefetch
 
 from core.models import Recipe, Tag, Ingredient
+from recipe.pagination import CachedCountPagination
 from recipe.serializers import (
     RecipeDetailSerializer,
     RecipeSerializer,
@@ -14,28 +22,135 @@ from recipe.serializers import (
     IngredientSerializer,
 )
 
+# tags and ingredients are attached separately; see _attach_recipe_attrs
+RECIPE_LIST_FIELDS = [
+    field
+    for field in RecipeSerializer.Meta.fields
+    if field not in ("tags", "ingredients")
+]
+
+_INT_CSV = re.compile(r"\d+(?:,\d+)*", re.ASCII)
+
+
+@lru_cache(maxsize=1024)
+def _parse_int_csv(value):
+    """Parse a comma separated list of ids, or return None if malformed."""
+    if not _INT_CSV.fullmatch(value):
+        return None
+    return tuple(map(int, value.split(",")))
+
 
 class RecipeViewset(viewsets.ModelViewSet):
     serializer_class = RecipeDetailSerializer
     queryset = Recipe.objects.all()
+    authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
+    pagination_class = CachedCountPagination
+    # DRF builds a new viewset per request, so this is request-scoped
+    _qs_cache = None
 
     def _params_to_ints(self, qs):
         """Convert a list of strings to integers."""
-        return [int(str_id) for str_id in qs.split(",")]
+        ids = _parse_int_csv(qs)
+        if ids is None:
+            raise ValidationError("Expected a comma separated list of ids.")
+        return list(ids)
 
     def get_queryset(self):
         """Retrieve recipes for authenticated user."""
+        if self._qs_cache is not None:
+            return self._qs_cache
+
         tags = self.request.query_params.get("tags")
         ingredients = self.request.query_params.get("ingredients")
         queryset = self.queryset
+        # Exists subqueries avoid the row fan-out of an M2M join (and a DISTINCT)
         if tags:
             tag_ids = self._params_to_ints(tags)
-            queryset = queryset.filter(tags__id__in=tag_ids)
+            queryset = queryset.filter(
+                Exists(
+                    Recipe.tags.through.objects.filter(
+                        recipe_id=OuterRef("pk"), tag_id__in=tag_ids
+                    )
+                )
+            )
         if ingredients:
             ingredient_ids = self._params_to_ints(ingredients)
-            queryset = queryset.filter(ingredients__id__in=ingredient_ids)
-        return queryset.filter(user=self.request.user).order_by("-id").distinct()
+            queryset = queryset.filter(
+                Exists(
+                    Recipe.ingredients.through.objects.filter(
+                        recipe_id=OuterRef("pk"), ingredient_id__in=ingredient_ids
+                    )
+                )
+            )
+        queryset = queryset.filter(user=self.request.user).order_by("-id")
+
+        if self.action == "list":
+            # plain rows skip model instantiation; see _attach_recipe_attrs
+            queryset = queryset.values(*RECIPE_LIST_FIELDS)
+        elif self.action == "retrieve":
+            # serializers render tags and ingredients, so load them in bulk
+            queryset = queryset.prefetch_related(
+                Prefetch("tags", queryset=Tag.objects.only("id", "name")),
+                Prefetch("ingredients", queryset=Ingredient.objects.only("id", "name")),
+            )
+        elif self.action == "destroy":
+            # deleting only needs the key and owner, not description or image
+            queryset = queryset.only("id", "user_id")
+
+        self._qs_cache = queryset
+        return queryset
+
+    def _attach_recipe_attrs(self, rows):
+        """Stitch tags and ingredients onto recipe rows with one query each."""
+        rows_by_id = {row["id"]: row for row in rows}
+        for attr, related in (("tags", "tag"), ("ingredients", "ingredient")):
+            for row in rows:
+                row[attr] = []
+            if not rows_by_id:
+                continue
+            links = (
+                getattr(Recipe, attr)
+                .through.objects.filter(recipe_id__in=rows_by_id)
+                .values_list("recipe_id", f"{related}_id", f"{related}__name")
+            )
+            for recipe_id, attr_id, name in links:
+                rows_by_id[recipe_id][attr].append({"id": attr_id, "name": name})
+
+    def list(self, request, *args, **kwargs):
+        """List recipes from plain rows, bypassing the serializer."""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = list(page if page is not None else queryset)
+        self._attach_recipe_attrs(rows)
+        for row in rows:
+            # match the string output of the serializer's DecimalField
+            row["price"] = f"{row['price']:f}"
+
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
+
+    def initialize_request(self, request, *args, **kwargs):
+        """Stream uploaded images to disk for the upload_image action."""
+        drf_request = super().initialize_request(request, *args, **kwargs)
+        if self.action == "upload_image":
+            # write to a temp file instead of buffering the image in memory
+            request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return drf_request
+
+    def get_object(self):
+        """Fetch just the image columns when uploading an image."""
+        if self.action != "upload_image":
+            return super().get_object()
+
+        recipe = get_object_or_404(
+            Recipe.objects.only("id", "image", "user_id"),
+            pk=self.kwargs["pk"],
+            user=self.request.user,
+        )
+        self.check_object_permissions(self.request, recipe)
+        return recipe
 
     def get_serializer_class(self):
         """Return the serializer class for request."""
@@ -95,24 +210,39 @@ class BaseRecipeAttrViewSet(
 
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
+    _qs_cache = None
 
     """
     Check for a query parameter assigned_only. 
     If this parameter is set to 1 (or true), it filters the queryset to include only 
-    those attributes (tags or ingredients) that are assigned to a recipe (recipe__isnull=False)
+    those attributes (tags or ingredients) that are assigned to a recipe (is_assigned=True)
     
     Further filters the queryset to include only the attributes that belong to the authenticated user
      (user=self.request.user).
     """
 
+    def _assigned_only(self):
+        return bool(int(self.request.query_params.get("assigned_only", 0)))
+
     def get_queryset(self):
         """Filter queryset to authenticated user."""
-        assigned_only = bool(int(self.request.query_params.get("assigned_only", 0)))
-        queryset = self.queryset
-        if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+        if self._qs_cache is not None:
+            return self._qs_cache
+
+        queryset = self.queryset.filter(user=self.request.user)
+        if self.action == "list":
+            # single object lookups need neither the filter nor the ordering
+            if self._assigned_only():
+                queryset = queryset.filter(is_assigned=True)
+            queryset = queryset.order_by("-name")
+        self._qs_cache = queryset
+        return queryset
 
-        return queryset.filter(user=self.request.user).order_by("-name").distinct()
+    def list(self, request, *args, **kwargs):
+        """List attributes from plain rows, bypassing the serializer."""
+        fields = self.get_serializer_class().Meta.fields
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(list(queryset.values(*fields)))
 
 
 """